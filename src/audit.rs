@@ -4,8 +4,8 @@ use blake3;
 use ed25519_dalek::{Signature, SigningKey, Signer, VerifyingKey};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
+use std::borrow::Cow;
 use std::fs;
-use std::io::{BufRead, BufReader};
 use std::path::Path;
 
 pub const HASH_ALG: &str = "blake3";
@@ -26,8 +26,8 @@ pub enum AuditRecord {
         last_entry_hash_b64: String,
         signature_b64: String,
         key_id: String,
-        hash_alg: String,
-        sig_alg: String,
+        hash_alg: Cow<'static, str>,
+        sig_alg: Cow<'static, str>,
         version: u32,
     },
 }
@@ -37,12 +37,18 @@ pub enum AuditRecord {
 pub struct IntegrityFields {
     pub prev_hash_b64: String,
     pub entry_hash_b64: String,
-    pub hash_alg: String,
+    // Always a known constant for records we emit; Cow avoids allocating a
+    // fresh String per record while still deserializing owned data.
+    pub hash_alg: Cow<'static, str>,
     pub version: u32,
 }
 
-/// Deterministic subset of McpLog used for hashing.
-/// payload is recursively canonicalized to sort object keys.
+/// Deterministic subset of McpLog used for hashing (v1 records only).
+///
+/// serde_json's Map is a BTreeMap (the `preserve_order` feature is not
+/// enabled anywhere in this crate's dependency graph), so object keys
+/// already serialize in sorted order and the payload can be hashed by
+/// reference without a canonicalization copy.
 #[derive(Debug, Clone, Serialize)]
 struct SignableMcpLog<'a> {
     run_id: &'a str,
@@ -53,31 +59,13 @@ struct SignableMcpLog<'a> {
     method: &'a Option<String>,
     request_id: &'a Option<u64>,
     latency_ms: &'a Option<u64>,
-    payload: Value,
+    payload: &'a Value,
     session_id: &'a str,
     trace_id: &'a str,
     span_id: &'a str,
     parent_span_id: &'a Option<String>,
 }
 
-fn canonicalize_value(v: &Value) -> Value {
-    match v {
-        Value::Object(map) => {
-            let mut keys: Vec<_> = map.keys().cloned().collect();
-            keys.sort();
-            let mut out = serde_json::Map::new();
-            for k in keys {
-                if let Some(val) = map.get(&k) {
-                    out.insert(k, canonicalize_value(val));
-                }
-            }
-            Value::Object(out)
-        }
-        Value::Array(arr) => Value::Array(arr.iter().map(canonicalize_value).collect()),
-        _ => v.clone(),
-    }
-}
-
 fn signable_bytes(log: &McpLog) -> Result<Vec<u8>, String> {
     let signable = SignableMcpLog {
         run_id: &log.run_id,
@@ -88,7 +76,7 @@ fn signable_bytes(log: &McpLog) -> Result<Vec<u8>, String> {
         method: &log.method,
         request_id: &log.request_id,
         latency_ms: &log.latency_ms,
-        payload: canonicalize_value(&log.payload),
+        payload: &log.payload,
         session_id: &log.session_id,
         trace_id: &log.trace_id,
         span_id: &log.span_id,
@@ -161,8 +149,9 @@ pub fn load_verify_key_b64(path: impl AsRef<Path>) -> Result<VerifyingKey, Strin
     VerifyingKey::from_bytes(&pk32).map_err(|e| format!("invalid verifying key: {e}"))
 }
 
-/// Compute entry hash = blake3(prev_hash || signable_bytes)
-pub fn compute_entry_hash(prev_hash: &[u8; 32], log: &McpLog) -> Result<[u8; 32], String> {
+/// v1 entry hash = blake3(prev_hash || signable JSON). Kept so logs written
+/// before the binary layout still verify.
+fn compute_entry_hash_v1(prev_hash: &[u8; 32], log: &McpLog) -> Result<[u8; 32], String> {
     let bytes = signable_bytes(log)?;
     let mut hasher = blake3::Hasher::new();
     hasher.update(prev_hash);
@@ -170,6 +159,69 @@ pub fn compute_entry_hash(prev_hash: &[u8; 32], log: &McpLog) -> Result<[u8; 32]
     Ok(*hasher.finalize().as_bytes())
 }
 
+fn hash_str(h: &mut blake3::Hasher, s: &str) {
+    h.update(&(s.len() as u64).to_le_bytes());
+    h.update(s.as_bytes());
+}
+
+fn hash_opt_str(h: &mut blake3::Hasher, s: &Option<String>) {
+    match s {
+        Some(s) => {
+            h.update(&[1]);
+            hash_str(h, s);
+        }
+        None => {
+            h.update(&[0]);
+        }
+    }
+}
+
+fn hash_opt_u64(h: &mut blake3::Hasher, v: &Option<u64>) {
+    match v {
+        Some(v) => {
+            h.update(&[1]);
+            h.update(&v.to_le_bytes());
+        }
+        None => {
+            h.update(&[0]);
+        }
+    }
+}
+
+/// Compute entry hash (v2): blake3 over a fixed-order, length-prefixed
+/// binary layout of the log fields, with the payload folded in as
+/// blake3(payload JSON).
+///
+/// Unlike the v1 JSON wrapper this never builds an intermediate document:
+/// scalar fields go straight into the hasher and the only serialization
+/// left is the payload itself. Length prefixes and option flags keep the
+/// encoding unambiguous.
+pub fn compute_entry_hash(prev_hash: &[u8; 32], log: &McpLog) -> Result<[u8; 32], String> {
+    let payload_bytes = serde_json::to_vec(&log.payload)
+        .map_err(|e| format!("failed to serialize payload: {e}"))?;
+    let payload_hash = blake3::hash(&payload_bytes);
+
+    let mut h = blake3::Hasher::new();
+    h.update(prev_hash);
+    hash_str(&mut h, &log.run_id);
+    h.update(&log.event_id.to_le_bytes());
+    h.update(&log.observed_ts_ms.to_le_bytes());
+    h.update(&log.timestamp.to_le_bytes());
+    h.update(&[match log.direction {
+        crate::events::StreamDirection::Inbound => 0,
+        crate::events::StreamDirection::Outbound => 1,
+    }]);
+    hash_opt_str(&mut h, &log.method);
+    hash_opt_u64(&mut h, &log.request_id);
+    hash_opt_u64(&mut h, &log.latency_ms);
+    h.update(payload_hash.as_bytes());
+    hash_str(&mut h, &log.session_id);
+    hash_str(&mut h, &log.trace_id);
+    hash_str(&mut h, &log.span_id);
+    hash_opt_str(&mut h, &log.parent_span_id);
+    Ok(*h.finalize().as_bytes())
+}
+
 /// Build an event record + updated prev hash.
 pub fn make_event_record(
     prev_hash: &[u8; 32],
@@ -181,8 +233,8 @@ pub fn make_event_record(
         integrity: IntegrityFields {
             prev_hash_b64: encode_b64_32(prev_hash),
             entry_hash_b64: encode_b64_32(&entry_hash),
-            hash_alg: HASH_ALG.to_string(),
-            version: 1,
+            hash_alg: Cow::Borrowed(HASH_ALG),
+            version: 2,
         },
     };
     Ok((rec, entry_hash))
@@ -208,8 +260,8 @@ pub fn make_checkpoint_record(
         last_entry_hash_b64: encode_b64_32(last_entry_hash),
         signature_b64: B64.encode(sig.to_bytes()),
         key_id,
-        hash_alg: HASH_ALG.to_string(),
-        sig_alg: SIG_ALG.to_string(),
+        hash_alg: Cow::Borrowed(HASH_ALG),
+        sig_alg: Cow::Borrowed(SIG_ALG),
         version: 1,
     }
 }
@@ -224,9 +276,13 @@ pub fn verify_audit_log_file(
     let vk = load_verify_key_b64(pubkey_path)?;
     let expected_key_id = key_id_from_pubkey(&vk);
 
-    let f = fs::File::open(log_path.as_ref())
-        .map_err(|e| format!("failed to open log file {:?}: {e}", log_path.as_ref()))?;
-    let reader = BufReader::new(f);
+    // Bulk verification: pull the whole file into one contiguous buffer and
+    // parse each line in place. serde_json::from_slice validates UTF-8 only
+    // where the JSON grammar requires it, so this skips the full per-line
+    // UTF-8 pass that a String-based read does, and there is no per-line
+    // buffer management at all.
+    let data = fs::read(log_path.as_ref())
+        .map_err(|e| format!("failed to read log file {:?}: {e}", log_path.as_ref()))?;
 
     let mut prev_hash = [0u8; 32];
     let mut last_event_id: u64 = 0;
@@ -235,15 +291,14 @@ pub fn verify_audit_log_file(
     let mut checkpoints_verified = 0u64;
     let mut events_verified = 0u64;
 
-    for (idx, line_res) in reader.lines().enumerate() {
+    for (idx, raw) in data.split(|&b| b == b'\n').enumerate() {
         let line_no = idx + 1;
-        let line = line_res.map_err(|e| format!("line {line_no}: read error: {e}"))?;
-        if line.trim().is_empty() {
+        if raw.iter().all(|b| b.is_ascii_whitespace()) {
             continue;
         }
 
         let rec: AuditRecord =
-            serde_json::from_str(&line).map_err(|e| format!("line {line_no}: JSON parse error: {e}"))?;
+            serde_json::from_slice(raw).map_err(|e| format!("line {line_no}: JSON parse error: {e}"))?;
 
         match rec {
             AuditRecord::Event { log, integrity } => {
@@ -278,9 +333,13 @@ pub fn verify_audit_log_file(
                     ));
                 }
 
-                // Recompute entry hash
-                let computed = compute_entry_hash(&prev_hash, &log)
-                    .map_err(|e| format!("line {line_no}: compute_entry_hash failed: {e}"))?;
+                // Recompute entry hash using the layout the record was written with
+                let computed = match integrity.version {
+                    1 => compute_entry_hash_v1(&prev_hash, &log),
+                    2 => compute_entry_hash(&prev_hash, &log),
+                    v => Err(format!("unsupported integrity version {v}")),
+                }
+                .map_err(|e| format!("line {line_no}: compute_entry_hash failed: {e}"))?;
                 let entry_b = decode_b64_32(&integrity.entry_hash_b64)
                     .map_err(|e| format!("line {line_no}: bad entry_hash_b64: {e}"))?;
 
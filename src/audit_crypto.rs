@@ -1,15 +1,15 @@
 use base64::{engine::general_purpose::STANDARD as B64, Engine as _};
 use chacha20poly1305::{
-    aead::{Aead, KeyInit, Payload},
+    aead::{Aead, AeadInPlace, KeyInit, Payload},
     ChaCha20Poly1305, Key, Nonce,
 };
 use hkdf::Hkdf;
-use rand::{rngs::OsRng, RngCore};
+use rand::{rngs::{OsRng, StdRng}, RngCore, SeedableRng};
 use serde::{Deserialize, Serialize};
 use sha2::{Digest, Sha256};
 use std::fs;
 use std::fs::File;
-use std::io::{BufRead, BufReader, Write};
+use std::io::{BufRead, BufReader, BufWriter, Write};
 use std::path::{Path, PathBuf};
 use tempfile::NamedTempFile;
 use x25519_dalek::{x25519, PublicKey, X25519_BASEPOINT_BYTES};
@@ -37,9 +37,9 @@ pub fn keygen_recipient(out_dir: impl AsRef<Path>) -> Result<(), String> {
     )
     .map_err(|e| format!("write recipient_pub.b64: {}", e))?;
 
-    println!("Generated recipient encryption keys (X25519)");
-    println!("  Private (KEEP SECRET): {:?}", out_dir.join("recipient_priv.b64"));
-    println!("  Public  (DISTRIBUTE):  {:?}", out_dir.join("recipient_pub.b64"));
+    eprintln!("Generated recipient encryption keys (X25519)");
+    eprintln!("  Private (KEEP SECRET): {:?}", out_dir.join("recipient_priv.b64"));
+    eprintln!("  Public  (DISTRIBUTE):  {:?}", out_dir.join("recipient_pub.b64"));
     Ok(())
 }
 
@@ -111,8 +111,57 @@ struct EncryptedRecord {
     version: u32,
     run_id: String,
     inner_type: String,
-    nonce_b64: String,
-    ciphertext_b64: String,
+
+    /// v2: base64(nonce || ciphertext) in one field — one encode per record
+    /// instead of two, and fewer bytes of JSON framing on disk.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    payload_b64: Option<String>,
+
+    /// v1 layout, still accepted when reading old logs.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    nonce_b64: Option<String>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    ciphertext_b64: Option<String>,
+}
+
+/// Extract (nonce, ciphertext) from either record layout.
+fn record_nonce_and_ct(rec: &EncryptedRecord) -> Result<([u8; 12], Vec<u8>), String> {
+    if let Some(p) = &rec.payload_b64 {
+        let mut blob = B64
+            .decode(p.trim())
+            .map_err(|e| format!("decode payload_b64: {}", e))?;
+        if blob.len() < 12 {
+            return Err("payload too short for nonce".to_string());
+        }
+        let ct = blob.split_off(12);
+        let mut nonce = [0u8; 12];
+        nonce.copy_from_slice(&blob);
+        return Ok((nonce, ct));
+    }
+
+    let nonce_b64 = rec
+        .nonce_b64
+        .as_deref()
+        .ok_or("record has neither payload_b64 nor nonce_b64")?;
+    let ct_b64 = rec
+        .ciphertext_b64
+        .as_deref()
+        .ok_or("record has nonce_b64 but no ciphertext_b64")?;
+
+    let nonce_bytes = B64
+        .decode(nonce_b64.trim())
+        .map_err(|e| format!("decode nonce: {}", e))?;
+    if nonce_bytes.len() != 12 {
+        return Err("bad nonce length".to_string());
+    }
+    let mut nonce = [0u8; 12];
+    nonce.copy_from_slice(&nonce_bytes);
+
+    let ct = B64
+        .decode(ct_b64.trim())
+        .map_err(|e| format!("decode ciphertext: {}", e))?;
+
+    Ok((nonce, ct))
 }
 
 /// ===== Envelope logic =====
@@ -217,7 +266,16 @@ pub enum AuditSink<'a, W: AsyncWrite + Unpin> {
     Encrypted {
         out: &'a mut W,
         run_id: String,
-        dek: DataKey,
+        // Built once from the DEK so the key schedule is not redone per record.
+        cipher: ChaCha20Poly1305,
+        // Userspace CSPRNG seeded from the OS once per sink; nonces come from
+        // here instead of a getrandom(2) syscall per record.
+        rng: StdRng,
+        // Reused per-record scratch: msg_buf holds nonce || ct || tag, aad_buf
+        // holds "run_id|inner". Encrypting in place with the detached API
+        // keeps the per-record path allocation-free up to serialization.
+        msg_buf: Vec<u8>,
+        aad_buf: Vec<u8>,
     },
 }
 
@@ -234,15 +292,21 @@ impl<'a, W: AsyncWrite + Unpin> AuditSink<'a, W> {
             let dek = DataKey::random();
             let env = build_envelope(run_id, &recipient_pub, &dek)?;
 
-            let line = serde_json::to_string(&env).map_err(|e| format!("serialize env: {}", e))?;
-            out.write_all(format!("{}\n", line).as_bytes())
+            let mut line = serde_json::to_vec(&env).map_err(|e| format!("serialize env: {}", e))?;
+            line.push(b'\n');
+            out.write_all(&line)
                 .await
                 .map_err(|e| format!("write KeyEnvelope: {}", e))?;
 
+            let cipher = ChaCha20Poly1305::new(Key::from_slice(&dek.0));
+
             Ok(Self::Encrypted {
                 out,
                 run_id: run_id.into(),
-                dek,
+                cipher,
+                rng: StdRng::from_entropy(),
+                msg_buf: Vec::new(),
+                aad_buf: Vec::new(),
             })
         } else {
             Ok(Self::Plain { out })
@@ -252,38 +316,49 @@ impl<'a, W: AsyncWrite + Unpin> AuditSink<'a, W> {
     pub async fn write_record(&mut self, inner: &str, json: &str) -> Result<(), String> {
         match self {
             Self::Plain { out } => {
-                out.write_all(format!("{}\n", json).as_bytes())
+                out.write_all(json.as_bytes())
+                    .await
+                    .map_err(|e| format!("write plaintext: {}", e))?;
+                out.write_all(b"\n")
                     .await
                     .map_err(|e| format!("write plaintext: {}", e))?;
             }
-            Self::Encrypted { out, run_id, dek } => {
-                let cipher = ChaCha20Poly1305::new(Key::from_slice(&dek.0));
+            Self::Encrypted { out, run_id, cipher, rng, msg_buf, aad_buf } => {
                 let mut nonce = [0u8; 12];
-                OsRng.fill_bytes(&mut nonce);
+                rng.fill_bytes(&mut nonce);
+
+                aad_buf.clear();
+                aad_buf.extend_from_slice(run_id.as_bytes());
+                aad_buf.push(b'|');
+                aad_buf.extend_from_slice(inner.as_bytes());
+
+                msg_buf.clear();
+                msg_buf.extend_from_slice(&nonce);
+                msg_buf.extend_from_slice(json.as_bytes());
 
-                let aad = format!("{}|{}", run_id, inner);
-                let ct = cipher
-                    .encrypt(
+                let tag = cipher
+                    .encrypt_in_place_detached(
                         Nonce::from_slice(&nonce),
-                        Payload {
-                            msg: json.as_bytes(),
-                            aad: aad.as_bytes(),
-                        },
+                        aad_buf,
+                        &mut msg_buf[12..],
                     )
                     .map_err(|_| "encrypt failed".to_string())?;
+                msg_buf.extend_from_slice(&tag);
 
                 let rec = EncryptedRecord {
                     record_type: "Encrypted".into(),
-                    version: 1,
+                    version: 2,
                     run_id: run_id.clone(),
                     inner_type: inner.into(),
-                    nonce_b64: B64.encode(nonce),
-                    ciphertext_b64: B64.encode(ct),
+                    payload_b64: Some(B64.encode(&msg_buf)),
+                    nonce_b64: None,
+                    ciphertext_b64: None,
                 };
 
-                let line =
-                    serde_json::to_string(&rec).map_err(|e| format!("serialize enc: {}", e))?;
-                out.write_all(format!("{}\n", line).as_bytes())
+                let mut line =
+                    serde_json::to_vec(&rec).map_err(|e| format!("serialize enc: {}", e))?;
+                line.push(b'\n');
+                out.write_all(&line)
                     .await
                     .map_err(|e| format!("write encrypted: {}", e))?;
             }
@@ -332,16 +407,26 @@ pub fn maybe_decrypt_to_temp_plaintext(
     let dek = unwrap_envelope(&env, &recipient_sk)?;
 
     let file = File::open(log_path).map_err(|e| format!("re-open audit log: {}", e))?;
-    let reader = BufReader::new(file);
+    // Bulk sequential scan: large read buffer, one reused line buffer, and
+    // buffered writes into the temp file instead of a syscall per line.
+    let mut reader = BufReader::with_capacity(1 << 20, file);
 
     let mut tmp =
         NamedTempFile::new().map_err(|e| format!("create temp file: {}", e))?;
+    let mut out = BufWriter::new(tmp.as_file_mut());
 
     let cipher = ChaCha20Poly1305::new(Key::from_slice(&dek.0));
     let mut saw_first = false;
-
-    for line_res in reader.lines() {
-        let line = line_res.map_err(|e| format!("read line: {}", e))?;
+    let mut line = String::new();
+
+    loop {
+        line.clear();
+        let n = reader
+            .read_line(&mut line)
+            .map_err(|e| format!("read line: {}", e))?;
+        if n == 0 {
+            break;
+        }
         let s = line.trim();
         if s.is_empty() {
             continue;
@@ -361,18 +446,7 @@ pub fn maybe_decrypt_to_temp_plaintext(
             return Err("run_id mismatch (possible splicing)".to_string());
         }
 
-        let nonce_bytes = B64
-            .decode(rec.nonce_b64.trim())
-            .map_err(|e| format!("decode nonce: {}", e))?;
-        if nonce_bytes.len() != 12 {
-            return Err("bad nonce length".to_string());
-        }
-        let mut nonce = [0u8; 12];
-        nonce.copy_from_slice(&nonce_bytes);
-
-        let ct = B64
-            .decode(rec.ciphertext_b64.trim())
-            .map_err(|e| format!("decode ciphertext: {}", e))?;
+        let (nonce, ct) = record_nonce_and_ct(&rec)?;
 
         let aad = format!("{}|{}", env.run_id, rec.inner_type);
 
@@ -389,9 +463,12 @@ pub fn maybe_decrypt_to_temp_plaintext(
         let pt_str =
             String::from_utf8(pt).map_err(|_| "decrypted payload not utf8".to_string())?;
 
-        writeln!(tmp, "{}", pt_str).map_err(|e| format!("write decrypted: {}", e))?;
+        writeln!(out, "{}", pt_str).map_err(|e| format!("write decrypted: {}", e))?;
     }
 
+    out.flush().map_err(|e| format!("flush decrypted output: {}", e))?;
+    drop(out);
+
     let (_file, path) = tmp
         .keep()
         .map_err(|e| format!("persist temp file: {}", e))?;
@@ -31,8 +31,14 @@ struct EncryptedRecord {
     version: u32,
     run_id: String,
     inner_type: String,
-    nonce_b64: String,
-    ciphertext_b64: String,
+    // v2 combined layout: base64(nonce || ciphertext)
+    #[serde(default)]
+    payload_b64: Option<String>,
+    // v1 split layout
+    #[serde(default)]
+    nonce_b64: Option<String>,
+    #[serde(default)]
+    ciphertext_b64: Option<String>,
 }
 
 fn read_privkey_b64(path: &str) -> Result<[u8; 32]> {
@@ -107,24 +113,39 @@ fn unwrap_dek(envelope: &KeyEnvelope, recipient_sk: &[u8; 32]) -> Result<[u8; 32
 
 fn decrypt_record(
     encrypted: &EncryptedRecord,
-    dek: &[u8; 32],
+    cipher: &ChaCha20Poly1305,
     run_id: &str,
 ) -> Result<String> {
-    let cipher = ChaCha20Poly1305::new(Key::from_slice(dek));
-    
-    // Decode nonce
-    let nonce_bytes = B64.decode(encrypted.nonce_b64.trim())
-        .context("Failed to decode nonce")?;
-    if nonce_bytes.len() != 12 {
-        anyhow::bail!("Nonce must be 12 bytes");
-    }
-    let mut nonce = [0u8; 12];
-    nonce.copy_from_slice(&nonce_bytes);
-    
-    // Decode ciphertext
-    let ciphertext = B64.decode(encrypted.ciphertext_b64.trim())
-        .context("Failed to decode ciphertext")?;
-    
+    // Decode nonce + ciphertext (v2 combined field or v1 split fields)
+    let (nonce, ciphertext) = if let Some(payload) = &encrypted.payload_b64 {
+        let mut blob = B64.decode(payload.trim())
+            .context("Failed to decode payload")?;
+        if blob.len() < 12 {
+            anyhow::bail!("Payload too short for nonce");
+        }
+        let ct = blob.split_off(12);
+        let mut nonce = [0u8; 12];
+        nonce.copy_from_slice(&blob);
+        (nonce, ct)
+    } else {
+        let nonce_b64 = encrypted.nonce_b64.as_deref()
+            .context("Record has neither payload_b64 nor nonce_b64")?;
+        let ct_b64 = encrypted.ciphertext_b64.as_deref()
+            .context("Record has nonce_b64 but no ciphertext_b64")?;
+
+        let nonce_bytes = B64.decode(nonce_b64.trim())
+            .context("Failed to decode nonce")?;
+        if nonce_bytes.len() != 12 {
+            anyhow::bail!("Nonce must be 12 bytes");
+        }
+        let mut nonce = [0u8; 12];
+        nonce.copy_from_slice(&nonce_bytes);
+
+        let ciphertext = B64.decode(ct_b64.trim())
+            .context("Failed to decode ciphertext")?;
+        (nonce, ciphertext)
+    };
+
     // Construct AAD (must match encryption)
     let aad = format!("{}|{}", run_id, encrypted.inner_type);
     
@@ -162,7 +183,9 @@ fn main() -> Result<()> {
         .context("Failed to open audit log")?;
     let reader = BufReader::new(file);
     
-    let mut dek: Option<[u8; 32]> = None;
+    // Cipher is built once after the DEK is unwrapped; the AEAD key schedule
+    // is reused across all records instead of being redone per line.
+    let mut cipher: Option<ChaCha20Poly1305> = None;
     let mut run_id: Option<String> = None;
     let mut line_num = 0;
     
@@ -185,8 +208,8 @@ fn main() -> Result<()> {
                 // Unwrap the DEK
                 let unwrapped_dek = unwrap_dek(&envelope, &recipient_sk)
                     .context(format!("Line {}: Failed to unwrap DEK", line_num))?;
-                
-                dek = Some(unwrapped_dek);
+
+                cipher = Some(ChaCha20Poly1305::new(Key::from_slice(&unwrapped_dek)));
                 run_id = Some(envelope.run_id.clone());
                 
                 eprintln!("   ✓ DEK unwrapped successfully\n");
@@ -197,7 +220,7 @@ fn main() -> Result<()> {
         // Try to parse as EncryptedRecord
         if let Ok(encrypted) = serde_json::from_str::<EncryptedRecord>(&line) {
             if encrypted.record_type == "Encrypted" {
-                let current_dek = dek
+                let current_cipher = cipher.as_ref()
                     .context(format!("Line {}: Found encrypted record before KeyEnvelope", line_num))?;
                 let current_run_id = run_id.as_ref()
                     .context(format!("Line {}: No run_id established", line_num))?;
@@ -213,7 +236,7 @@ fn main() -> Result<()> {
                 }
                 
                 // Decrypt and print
-                let plaintext = decrypt_record(&encrypted, &current_dek, current_run_id)
+                let plaintext = decrypt_record(&encrypted, current_cipher, current_run_id)
                     .context(format!("Line {}: Failed to decrypt record", line_num))?;
                 
                 println!("{}", plaintext);
@@ -33,6 +33,15 @@ pub fn current_timestamp_ms() -> u64 {
         .as_millis() as u64
 }
 
+/// Random v4 UUID for per-message span IDs.
+///
+/// `Uuid::new_v4()` calls getrandom(2) on every invocation; on the
+/// per-message hot path we draw from the thread-local CSPRNG instead,
+/// which reseeds from the OS periodically but costs no syscall per ID.
+pub fn new_span_id() -> String {
+    uuid::Builder::from_random_bytes(rand::random()).into_uuid().to_string()
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct McpLog {
 
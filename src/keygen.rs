@@ -26,9 +26,9 @@ pub fn generate_keypair(out_dir: impl AsRef<Path>) -> Result<(), String> {
     fs::write(&pub_path, format!("{}\n", pub_b64))
         .map_err(|e| format!("failed to write {:?}: {}", pub_path, e))?;
 
-    println!("Generated Sentinel signing keypair:");
-    println!("  Private key (KEEP SECRET): {:?}", seed_path);
-    println!("  Public key  (SHARE):       {:?}", pub_path);
+    eprintln!("Generated Sentinel signing keypair:");
+    eprintln!("  Private key (KEEP SECRET): {:?}", seed_path);
+    eprintln!("  Public key  (SHARE):       {:?}", pub_path);
 
     Ok(())
 }
@@ -6,6 +6,7 @@ use tokio::sync::{broadcast, mpsc, RwLock};
 use uuid::Uuid;
 use std::path::Path;
 use std::collections::VecDeque;
+use std::time::Duration;
 
 mod proxy;
 mod protocol;
@@ -160,9 +161,15 @@ fn read_first_checkpoint(log_path: &Path) -> Result<audit::AuditRecord, Box<dyn
         if line.trim().is_empty() {
             continue;
         }
-        
+
+        // Cheap substring pre-filter: only lines that can be checkpoints are
+        // worth deserializing, and most lines in a log are events.
+        if !line.contains("\"record_type\":\"Checkpoint\"") {
+            continue;
+        }
+
         let record: audit::AuditRecord = serde_json::from_str(&line)?;
-        
+
         if matches!(record, audit::AuditRecord::Checkpoint { .. }) {
             return Ok(record);
         }
@@ -299,7 +306,7 @@ async fn run(args: RunArgs) -> Result<(), Box<dyn std::error::Error>> {
 
     // Audit + history + broadcast
     let audit_handle = tokio::spawn(async move {
-        let mut file = match tokio::fs::OpenOptions::new()
+        let file = match tokio::fs::OpenOptions::new()
             .create(true)
             .truncate(true)
             .write(true)
@@ -313,6 +320,10 @@ async fn run(args: RunArgs) -> Result<(), Box<dyn std::error::Error>> {
             }
         };
 
+        // Buffer writes so each record is not its own syscall; a periodic
+        // flush below bounds how long a record can sit in the buffer.
+        let mut file = tokio::io::BufWriter::with_capacity(64 * 1024, file);
+
         let mut sink = match audit_crypto::AuditSink::new(
             &mut file,
             &run_id,
@@ -331,83 +342,120 @@ async fn run(args: RunArgs) -> Result<(), Box<dyn std::error::Error>> {
         let mut since_last_checkpoint = 0;
         let mut last_event_id = 0u64;
 
+        let mut flush_interval = tokio::time::interval(Duration::from_millis(500));
+        let mut batch: Vec<events::McpLog> = Vec::with_capacity(256);
+
         loop {
             let maybe_log = tokio::select! {
                 log = log_rx.recv() => log,
+                _ = flush_interval.tick() => {
+                    if let Err(e) = sink.flush().await {
+                        eprintln!("❌ Failed to flush audit log: {}", e);
+                    }
+                    continue;
+                }
                 _ = audit_shutdown_rx.recv() => {
                     eprintln!("🔒 Audit loop received shutdown signal");
                     None
                 }
             };
 
-            let mut log = match maybe_log {
+            let first = match maybe_log {
                 Some(l) => l,
                 None => break,
             };
 
-            if enable_redaction {
-                redaction::redact_log(&mut log);
+            // Drain whatever is already queued so a burst is handled as one
+            // batch: the history lock is taken once per batch instead of once
+            // per event.
+            batch.clear();
+            batch.push(first);
+            while batch.len() < 256 {
+                match log_rx.try_recv() {
+                    Ok(l) => batch.push(l),
+                    Err(_) => break,
+                }
             }
 
-            let (rec, hash) = match audit::make_event_record(&prev_hash, log.clone()) {
-                Ok(r) => r,
-                Err(e) => {
-                    eprintln!("❌ Failed to create event record: {}", e);
-                    continue;
-                }
-            };
+            let mut written: Vec<events::McpLog> = Vec::with_capacity(batch.len());
 
-            let rec_json = match serde_json::to_string(&rec) {
-                Ok(j) => j,
-                Err(e) => {
-                    eprintln!("❌ Failed to serialize event record: {}", e);
-                    continue;
+            for mut log in batch.drain(..) {
+                if enable_redaction {
+                    redaction::redact_log(&mut log);
                 }
-            };
-
-            if let Err(e) = sink.write_record("Event", &rec_json).await {
-                eprintln!("❌ Failed to write event record: {}", e);
-                continue;
-            }
 
-            prev_hash = hash;
-            last_event_id = log.event_id;
-            since_last_checkpoint += 1;
-
-            if signing_key.is_some() && since_last_checkpoint >= checkpoint_every {
-                let cp = audit::make_checkpoint_record(
-                    signing_key.as_ref().unwrap(),
-                    &run_id,
-                    events::current_timestamp_ms(),
-                    last_event_id,
-                    &prev_hash,
-                );
+                // The record takes ownership of the log; it is moved back out
+                // below once the write succeeds, so no per-event deep clone of
+                // the payload is needed.
+                let (rec, hash) = match audit::make_event_record(&prev_hash, log) {
+                    Ok(r) => r,
+                    Err(e) => {
+                        eprintln!("❌ Failed to create event record: {}", e);
+                        continue;
+                    }
+                };
 
-                let cp_json = match serde_json::to_string(&cp) {
+                let rec_json = match serde_json::to_string(&rec) {
                     Ok(j) => j,
                     Err(e) => {
-                        eprintln!("❌ Failed to serialize checkpoint: {}", e);
-                        since_last_checkpoint = 0;
+                        eprintln!("❌ Failed to serialize event record: {}", e);
                         continue;
                     }
                 };
 
-                if let Err(e) = sink.write_record("Checkpoint", &cp_json).await {
-                    eprintln!("❌ Failed to write checkpoint: {}", e);
+                if let Err(e) = sink.write_record("Event", &rec_json).await {
+                    eprintln!("❌ Failed to write event record: {}", e);
+                    continue;
+                }
+
+                let log = match rec {
+                    audit::AuditRecord::Event { log, .. } => log,
+                    _ => unreachable!("make_event_record always builds an Event"),
+                };
+
+                prev_hash = hash;
+                last_event_id = log.event_id;
+                since_last_checkpoint += 1;
+
+                if signing_key.is_some() && since_last_checkpoint >= checkpoint_every {
+                    let cp = audit::make_checkpoint_record(
+                        signing_key.as_ref().unwrap(),
+                        &run_id,
+                        events::current_timestamp_ms(),
+                        last_event_id,
+                        &prev_hash,
+                    );
+
+                    match serde_json::to_string(&cp) {
+                        Ok(cp_json) => {
+                            if let Err(e) = sink.write_record("Checkpoint", &cp_json).await {
+                                eprintln!("❌ Failed to write checkpoint: {}", e);
+                            }
+                        }
+                        Err(e) => {
+                            eprintln!("❌ Failed to serialize checkpoint: {}", e);
+                        }
+                    }
+
+                    since_last_checkpoint = 0;
                 }
 
-                since_last_checkpoint = 0;
+                written.push(log);
             }
 
             {
                 let mut hist = state_for_audit.history.write().await;
-                hist.push_back(log.clone());
-                if hist.len() > 10_000 {
+                for log in &written {
+                    hist.push_back(log.clone());
+                }
+                while hist.len() > 10_000 {
                     hist.pop_front();
                 }
             }
 
-            let _ = ws_tx_for_audit.send(log);
+            for log in written {
+                let _ = ws_tx_for_audit.send(log);
+            }
         }
 
         if let Some(ref sk) = signing_key {
@@ -458,10 +506,15 @@ async fn run(args: RunArgs) -> Result<(), Box<dyn std::error::Error>> {
         let _ = shutdown_tx.send(()).await;
     });
 
+    let mut child_exit_code: Option<i32> = None;
+
     tokio::select! {
         result = run_proxy(args.command, raw_tx) => {
             match result {
-                Ok(_) => eprintln!("📋 Proxy completed successfully"),
+                Ok(code) => {
+                    eprintln!("📋 Proxy completed successfully");
+                    child_exit_code = Some(code);
+                }
                 Err(e) => eprintln!("❌ Proxy error: {}", e),
             }
         }
@@ -481,5 +534,11 @@ async fn run(args: RunArgs) -> Result<(), Box<dyn std::error::Error>> {
     }
 
     eprintln!("✅ Sentinel shutdown complete");
+
+    // Mirror the child's exit code, but only after the audit log is flushed.
+    if let Some(code) = child_exit_code {
+        process::exit(code);
+    }
+
     Ok(())
 }
\ No newline at end of file
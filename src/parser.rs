@@ -1,4 +1,4 @@
-use crate::events::{McpLog, StreamDirection, TapEvent};
+use crate::events::{new_span_id, McpLog, StreamDirection, TapEvent};
 use crate::protocol::JsonRpcMessage;
 use crate::session::Session;
 
@@ -7,7 +7,6 @@ use std::collections::HashMap;
 use std::sync::Arc;
 use std::time::Instant;
 use tokio::sync::mpsc;
-use uuid::Uuid;
 
 /// Parser converts raw tapped bytes into structured MCP logs
 pub struct Parser {
@@ -48,9 +47,8 @@ impl Parser {
                 }
                 expected_id = evt.event_id + 1;
                 let direction = evt.direction;
-                let bytes = evt.bytes.clone();
 
-                let message: JsonRpcMessage = match serde_json::from_slice(&bytes) {
+                let message: JsonRpcMessage = match serde_json::from_slice(&evt.bytes) {
                         Ok(m) => m,
                         Err(_) => continue, // Ignore non-JSON
                     };
@@ -60,7 +58,7 @@ impl Parser {
                 // Outbound REQUEST
                 // ----------------------------
                 (StreamDirection::Outbound, JsonRpcMessage::Request(req)) => {
-                    let span_id = Uuid::new_v4().to_string();
+                    let span_id = new_span_id();
                     let start = Instant::now();
 
                     if let Some(request_id) = req.id {
@@ -91,10 +89,10 @@ impl Parser {
                     if let Some((span, start)) = self.pending_spans.remove(&id) {
                         (span, Some(start.elapsed().as_millis() as u64))
                     } else {
-                        (Uuid::new_v4().to_string(), None)
+                        (new_span_id(), None)
                     }
                 } else {
-                    (Uuid::new_v4().to_string(), None)
+                    (new_span_id(), None)
                 };
 
                 let log = McpLog::from_message(
@@ -120,12 +118,3 @@ impl Parser {
         Ok(())
     }
 }
-
-fn current_timestamp() -> u64 {
-    use std::time::{SystemTime, UNIX_EPOCH};
-
-    SystemTime::now()
-        .duration_since(UNIX_EPOCH)
-        .unwrap_or_default()
-        .as_millis() as u64
-}
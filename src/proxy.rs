@@ -1,14 +1,16 @@
 use crate::events::{current_timestamp_ms, RawTap, StreamDirection};
 use bytes::Bytes;
-use std::process::{self, Stdio};
+use std::process::Stdio;
 use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
 use tokio::process::Command;
 use tokio::sync::mpsc;
 
+/// Proxy the child's stdio, tapping both directions. Returns the child's
+/// exit code so the caller can finish flushing the audit log before exiting.
 pub async fn run_proxy(
     command: Vec<String>,
     raw_sender: mpsc::Sender<RawTap>,
-) -> Result<(), Box<dyn std::error::Error>> {
+) -> Result<i32, Box<dyn std::error::Error>> {
     if command.is_empty() {
         return Err("Empty command".into());
     }
@@ -103,5 +105,5 @@ pub async fn run_proxy(
 
     let _ = tokio::join!(stdin_handle, stdout_handle);
     let status = child.wait().await?;
-    process::exit(status.code().unwrap_or(1));
+    Ok(status.code().unwrap_or(1))
 }
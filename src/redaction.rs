@@ -1,46 +1,69 @@
-use regex::Regex;
+use regex::{Regex, RegexSet};
 use serde_json::Value;
 
+const API_KEY_RE: &str = r#"(?i)(?:api[_-]?key|apikey|access[_-]?token|secret[_-]?key)\s*[:=]\s*["']?([a-zA-Z0-9_\-]{32,})["']?"#;
+const SK_KEY_RE: &str = r#"sk-[a-zA-Z0-9]{32,}"#;
+const EMAIL_RE: &str = r#"\b[\w\.-]+@[\w\.-]+\.\w+\b"#;
+const TOKEN_RE: &str = r#"(?i)(?:token|bearer)\s*[:=]\s*["']?([a-zA-Z0-9_\-\.]{20,})["']?"#;
+
 lazy_static::lazy_static! {
-    static ref API_KEY_PATTERN: Regex = Regex::new(r#"(?i)(?:api[_-]?key|apikey|access[_-]?token|secret[_-]?key)\s*[:=]\s*["']?([a-zA-Z0-9_\-]{32,})["']?"#).unwrap();
-    static ref SK_KEY_PATTERN: Regex = Regex::new(r#"sk-[a-zA-Z0-9]{32,}"#).unwrap();
-    static ref EMAIL_PATTERN: Regex = Regex::new(r#"\b[\w\.-]+@[\w\.-]+\.\w+\b"#).unwrap();
-    static ref TOKEN_PATTERN: Regex = Regex::new(r#"(?i)(?:token|bearer)\s*[:=]\s*["']?([a-zA-Z0-9_\-\.]{20,})["']?"#).unwrap();
+    static ref API_KEY_PATTERN: Regex = Regex::new(API_KEY_RE).unwrap();
+    static ref SK_KEY_PATTERN: Regex = Regex::new(SK_KEY_RE).unwrap();
+    static ref EMAIL_PATTERN: Regex = Regex::new(EMAIL_RE).unwrap();
+    static ref TOKEN_PATTERN: Regex = Regex::new(TOKEN_RE).unwrap();
+
+    // One combined scan decides which patterns hit at all; most strings are
+    // clean, so the common case is a single pass and zero allocations.
+    static ref REDACTION_SET: RegexSet =
+        RegexSet::new([API_KEY_RE, SK_KEY_RE, EMAIL_RE, TOKEN_RE]).unwrap();
 }
 
 pub fn redact_pii(value: &mut Value) {
     match value {
         Value::String(s) => {
+            let matched = REDACTION_SET.matches(s);
+            if !matched.matched_any() {
+                return;
+            }
+
             let mut redacted = s.clone();
-            
+
             // Redact API keys
-            redacted = API_KEY_PATTERN.replace_all(&redacted, |caps: &regex::Captures<'_>| {
-                let matched = caps.get(0).map(|m| m.as_str()).unwrap_or("");
-                format!("{}***", &matched[..8.min(matched.len())])
-            }).to_string();
-            
+            if matched.matched(0) {
+                redacted = API_KEY_PATTERN.replace_all(&redacted, |caps: &regex::Captures<'_>| {
+                    let matched = caps.get(0).map(|m| m.as_str()).unwrap_or("");
+                    format!("{}***", &matched[..8.min(matched.len())])
+                }).to_string();
+            }
+
             // Redact sk- keys
-            redacted = SK_KEY_PATTERN.replace_all(&redacted, |caps: &regex::Captures<'_>| {
-                let matched = caps.get(0).map(|m| m.as_str()).unwrap_or("");
-                format!("{}***", &matched[..8.min(matched.len())])
-            }).to_string();
-            
+            if matched.matched(1) {
+                redacted = SK_KEY_PATTERN.replace_all(&redacted, |caps: &regex::Captures<'_>| {
+                    let matched = caps.get(0).map(|m| m.as_str()).unwrap_or("");
+                    format!("{}***", &matched[..8.min(matched.len())])
+                }).to_string();
+            }
+
             // Redact emails
-            redacted = EMAIL_PATTERN.replace_all(&redacted, |caps: &regex::Captures<'_>| {
-                let email = caps.get(0).map(|m| m.as_str()).unwrap_or("");
-                if let Some(at_pos) = email.find('@') {
-                    format!("{}***@***", &email[..at_pos.min(3)])
-                } else {
-                    "***".to_string()
-                }
-            }).to_string();
-            
+            if matched.matched(2) {
+                redacted = EMAIL_PATTERN.replace_all(&redacted, |caps: &regex::Captures<'_>| {
+                    let email = caps.get(0).map(|m| m.as_str()).unwrap_or("");
+                    if let Some(at_pos) = email.find('@') {
+                        format!("{}***@***", &email[..at_pos.min(3)])
+                    } else {
+                        "***".to_string()
+                    }
+                }).to_string();
+            }
+
             // Redact tokens
-            redacted = TOKEN_PATTERN.replace_all(&redacted, |caps: &regex::Captures<'_>| {
-                let matched = caps.get(0).map(|m| m.as_str()).unwrap_or("");
-                format!("{}***", &matched[..8.min(matched.len())])
-            }).to_string();
-            
+            if matched.matched(3) {
+                redacted = TOKEN_PATTERN.replace_all(&redacted, |caps: &regex::Captures<'_>| {
+                    let matched = caps.get(0).map(|m| m.as_str()).unwrap_or("");
+                    format!("{}***", &matched[..8.min(matched.len())])
+                }).to_string();
+            }
+
             if redacted != *s {
                 *value = Value::String(redacted);
             }
@@ -62,4 +85,3 @@ pub fn redact_pii(value: &mut Value) {
 pub fn redact_log(log: &mut crate::events::McpLog) {
     redact_pii(&mut log.payload);
 }
-
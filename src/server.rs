@@ -117,8 +117,13 @@ async fn websocket_handler(
     State(state): State<Arc<ServerState>>,
 ) -> Result<Response, StatusCode> {
     if let Some(ref expected_token) = state.auth_token {
+        // Compare digests rather than the strings themselves: blake3::Hash
+        // equality is constant-time, so the check leaks neither length nor
+        // a matching prefix of the token.
         match params.token {
-            Some(provided) if provided == *expected_token => {}
+            Some(provided)
+                if blake3::hash(provided.as_bytes())
+                    == blake3::hash(expected_token.as_bytes()) => {}
             Some(_) => {
                 eprintln!("❌ WebSocket authentication failed: invalid token");
                 return Err(StatusCode::UNAUTHORIZED);
@@ -1,6 +1,6 @@
+use crate::events::{current_timestamp_ms, new_span_id};
 use std::collections::HashMap;
-use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
-use uuid::Uuid;
+use std::time::{Duration, Instant};
 
 
 pub struct Session {
@@ -25,12 +25,8 @@ impl SessionTracker {
     }
 
     pub fn start_span(&mut self, request_id: u64) -> String {
-        let span_id = Uuid::new_v4().to_string();
-
-        let timestamp = SystemTime::now()
-            .duration_since(UNIX_EPOCH)
-            .unwrap_or_default()
-            .as_millis() as u64;
+        let span_id = new_span_id();
+        let timestamp = current_timestamp_ms();
 
         self.pending.insert(request_id, (timestamp, span_id.clone()));
         span_id